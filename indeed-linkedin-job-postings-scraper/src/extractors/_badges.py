@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import re
+from typing import Iterable, Tuple
+
+# One alternation covers every keyword, so each badge string is scanned once.
+_BADGE_RE = re.compile(
+    r"(?P<jobtype>full[- ]time|part[- ]time|contract|internship)"
+    r"|(?P<remote>remote)"
+    r"|(?P<onsite>on[- ]site)",
+    re.IGNORECASE,
+)
+_JOBTYPE_LABELS = {
+    "full-time": "Full-time",
+    "part-time": "Part-time",
+    "contract": "Contract",
+    "internship": "Internship",
+}
+
+def classify_badges(badge_texts: Iterable[str], remote_wins: bool = True) -> Tuple[str, str]:
+    """
+    Derive (jobtype, remote) from the badge / metadata strings of one job card.
+
+    jobtype is taken from the last badge naming one ("" if none does). remote is
+    "Yes", "No" or "Unknown". With ``remote_wins`` (Indeed) any remote badge
+    means "Yes" and on-site only applies otherwise; without it (LinkedIn) the
+    last badge mentioning either decides, on-site taking precedence within it.
+    """
+    jobtype = ""
+    remote = "Unknown"
+    saw_remote = saw_onsite = False
+
+    for text in badge_texts:
+        text_jobtype = ""
+        text_remote = text_onsite = False
+        for match in _BADGE_RE.finditer(text):
+            kind = match.lastgroup
+            if kind == "jobtype":
+                if not text_jobtype:
+                    text_jobtype = match.group(0)
+            elif kind == "remote":
+                text_remote = True
+            else:
+                text_onsite = True
+
+        if text_jobtype:
+            jobtype = _JOBTYPE_LABELS[text_jobtype.lower().replace(" ", "-")]
+
+        if remote_wins:
+            saw_remote = saw_remote or text_remote
+            saw_onsite = saw_onsite or text_onsite
+        elif text_onsite:
+            remote = "No"
+        elif text_remote:
+            remote = "Yes"
+
+    if remote_wins:
+        if saw_remote:
+            remote = "Yes"
+        elif saw_onsite:
+            remote = "No"
+
+    return jobtype, remote
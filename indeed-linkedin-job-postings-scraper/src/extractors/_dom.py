@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from typing import Any, Iterator, List, Optional, Sequence, Tuple
+
+from lxml import etree  # type: ignore[import-untyped]
+
+from extractors._stream import SKIPPED_TAGS, iter_cards
+
+try:
+    # Optional fast path: selectolax wraps the Lexbor C HTML5 parser.
+    from selectolax.lexbor import LexborHTMLParser  # type: ignore[import-untyped]
+except ImportError:
+    LexborHTMLParser = None
+
+def _has_class(name: str) -> str:
+    """Return an XPath predicate matching elements carrying the CSS class ``name``."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+def css_to_xpath(css: str) -> str:
+    """
+    Translate the small CSS subset used by the parsers into a relative XPath.
+
+    Supported: type and class selectors ('h2.jobTitle', '.x'), the descendant
+    combinator, and comma-separated groups (translated to an XPath union).
+    """
+    branches = []
+    for group in css.split(","):
+        steps = []
+        for compound in group.split():
+            tag, *classes = compound.split(".")
+            predicates = "".join(f"[{_has_class(cls)}]" for cls in classes)
+            steps.append(f"{tag or '*'}{predicates}")
+        branches.append(".//" + "//".join(steps))
+    return " | ".join(branches)
+
+class Selector:
+    """
+    A CSS selector together with its XPath translation, compiled once.
+
+    Either backend can evaluate it: selectolax uses ``css`` directly and lxml
+    uses the precompiled ``xpath``. Comma groups match in document order.
+    """
+
+    __slots__ = ("css", "xpath")
+
+    def __init__(self, css: str) -> None:
+        self.css = css
+        self.xpath = etree.XPath(css_to_xpath(css))
+
+class LxmlBackend:
+    """Streams cards out of the page with lxml and queries them with XPath."""
+
+    def iter_cards(self, html: str | bytes, matchers: Sequence[Tuple[str, str]]) -> Iterator[Any]:
+        return iter_cards(html, matchers)
+
+    def all(self, node: Any, selector: Selector) -> List[Any]:
+        return selector.xpath(node)
+
+    def first(self, node: Any, *selectors: Selector) -> Any:
+        """Return the first element matched by the first selector that matches anything."""
+        for selector in selectors:
+            found = selector.xpath(node)
+            if found:
+                return found[0]
+        return None
+
+    def text(self, node: Any, sep: str = "") -> str:
+        """Join the stripped, non-empty text fragments of ``node`` with ``sep``."""
+        return sep.join(s for s in (t.strip() for t in node.itertext()) if s)
+
+    def attr(self, node: Any, name: str) -> Optional[str]:
+        return node.get(name)
+
+class LexborBackend:
+    """Parses the whole page with selectolax/Lexbor and queries it with CSS."""
+
+    def iter_cards(self, html: str | bytes, matchers: Sequence[Tuple[str, str]]) -> Iterator[Any]:
+        tree = LexborHTMLParser(html)
+        # Match the lxml path, which never builds these subtrees.
+        for node in tree.css(", ".join(sorted(SKIPPED_TAGS))):
+            node.decompose()
+        for tag, css_class in matchers:
+            cards = tree.css(f"{tag}.{css_class}")
+            if cards:
+                return iter(cards)
+        return iter(())
+
+    def all(self, node: Any, selector: Selector) -> List[Any]:
+        return node.css(selector.css)
+
+    def first(self, node: Any, *selectors: Selector) -> Any:
+        """Return the first element matched by the first selector that matches anything."""
+        for selector in selectors:
+            found = node.css_first(selector.css)
+            if found is not None:
+                return found
+        return None
+
+    def text(self, node: Any, sep: str = "") -> str:
+        """Join the stripped, non-empty text fragments of ``node`` with ``sep``."""
+        # Lexbor keeps empty pieces when stripping; split them out on a sentinel.
+        pieces = node.text(separator="\0", strip=True).split("\0")
+        return sep.join(filter(None, pieces))
+
+    def attr(self, node: Any, name: str) -> Optional[str]:
+        return node.attributes.get(name)
+
+# selectolax is used when installed; lxml remains the always-available fallback.
+DEFAULT_BACKEND: LxmlBackend | LexborBackend = (
+    LexborBackend() if LexborHTMLParser is not None else LxmlBackend()
+)
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import codecs
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from lxml import etree  # type: ignore[import-untyped]
+
+# Large enough to keep parser call overhead negligible, small enough that only a
+# fraction of the page is ever held as an extra copy while feeding.
+CHUNK_SIZE = 64 * 1024
+
+# Subtrees that never carry job data; inside a card they are dropped instead of
+# being built, the same way a SoupStrainer would filter them out.
+SKIPPED_TAGS = frozenset({"script", "style", "noscript", "template", "svg"})
+
+class CardCollector:
+    """
+    lxml parser target that only builds element trees for job-card subtrees.
+
+    ``matchers`` is an ordered list of (tag, css_class) pairs, one per layout
+    variant. Markup outside a matching card is discarded as it streams past, so
+    the full page DOM is never constructed. Inside an open card, only starts of
+    the same tier open further cards. This keeps the cards that libxml2 nests
+    when it recovers from unclosed tags, the same as a CSS select would. Other
+    tiers are ignored there, so e.g. a 'td.resultContent' inside a
+    'div.job_seen_beacon' does not become a card of its own.
+    Within a card, ``SKIPPED_TAGS`` subtrees (inline scripts, icons) are skipped.
+    """
+
+    def __init__(self, matchers: Sequence[Tuple[str, str]]) -> None:
+        self._matchers = list(matchers)
+        self.cards: List[List[Any]] = [[] for _ in self._matchers]
+        # Open cards, innermost last, as (builder, depth it closes at, slot).
+        self._open: List[Tuple[etree.TreeBuilder, int, int]] = []
+        # Cards nested in the current outermost one, in document (start) order.
+        self._pending: List[Any] = []
+        self._tier = -1
+        self._depth = 0
+        self._skip_depth = 0
+
+    def _match(self, tag: str, attrib: Dict[str, str]) -> int:
+        classes = attrib.get("class")
+        if not classes:
+            return -1
+        class_list = classes.split()
+        for tier, (match_tag, match_class) in enumerate(self._matchers):
+            if tag == match_tag and match_class in class_list:
+                return tier
+        return -1
+
+    def start(self, tag: str, attrib: Dict[str, str]) -> None:
+        if not self._open:
+            tier = self._match(tag, attrib)
+            if tier < 0:
+                return
+            self._tier = tier
+            self._depth = 0
+        elif self._skip_depth or tag in SKIPPED_TAGS:
+            self._skip_depth += 1
+            return
+        else:
+            tier = self._match(tag, attrib)
+        if tier == self._tier:
+            # Reserve the slot now: nested cards close before the outer one.
+            self._open.append((etree.TreeBuilder(), self._depth, len(self._pending)))
+            self._pending.append(None)
+        self._depth += 1
+        attrib = dict(attrib)
+        for builder, _, _ in self._open:
+            builder.start(tag, attrib)
+
+    def end(self, tag: str) -> None:
+        if not self._open:
+            return
+        if self._skip_depth:
+            self._skip_depth -= 1
+            return
+        for builder, _, _ in self._open:
+            builder.end(tag)
+        self._depth -= 1
+        while self._open and self._open[-1][1] == self._depth:
+            builder, _, slot = self._open.pop()
+            self._pending[slot] = builder.close()
+        if not self._open:
+            self.cards[self._tier].extend(self._pending)
+            self._pending = []
+
+    def data(self, data: str) -> None:
+        if self._open and not self._skip_depth:
+            for builder, _, _ in self._open:
+                builder.data(data)
+
+    def close(self) -> List[List[Any]]:
+        return self.cards
+
+def iter_cards(html: str | bytes, matchers: Sequence[Tuple[str, str]]) -> Iterator[Any]:
+    """
+    Stream ``html`` through lxml and lazily yield cards for the first matcher
+    that finds anything, mirroring the "try selector A, else B" fallback chains.
+
+    Cards for the primary matcher are yielded as soon as they close, so a caller
+    that stops early (e.g. at ``max_results``) also stops the parse. Fallback
+    layouts are only needed when the primary one never matched, so they are
+    buffered and yielded at the end.
+
+    ``bytes`` input is taken as UTF-8 and decoded one chunk at a time, so the
+    whole page is never copied into a ``str``. Invalid bytes become U+FFFD
+    instead of aborting the parse, as they do with the Lexbor backend.
+    """
+    collector = CardCollector(matchers)
+    parser = etree.HTMLParser(target=collector)
+    decode = None
+    if isinstance(html, bytes):
+        decode = codecs.getincrementaldecoder("utf-8")("replace").decode
+    primary = collector.cards[0]
+    yielded = False
+
+    # Chunks always end right before a '<'. libxml2's push parser stops emitting
+    # events if a chunk boundary falls inside a '</script>' end tag, and a cut
+    # before '<' can never land inside a tag or a multi-byte UTF-8 sequence.
+    tag_open = "<" if isinstance(html, str) else b"<"
+    offset = 0
+    while offset < len(html):
+        cut = html.find(tag_open, offset + CHUNK_SIZE)
+        if cut == -1:
+            cut = len(html)
+        chunk = html[offset:cut]
+        parser.feed(decode(chunk, cut == len(html)) if decode else chunk)
+        offset = cut
+        if primary:
+            yielded = True
+            ready = primary[:]
+            primary.clear()
+            yield from ready
+
+    tiers = parser.close()
+    if primary:
+        yielded = True
+        yield from primary
+    if not yielded:
+        yield from next((cards for cards in tiers[1:] if cards), [])
@@ -1,18 +1,100 @@
-thonfrom __future__ import annotations
+from __future__ import annotations
 
+import functools
+import html as html_lib
+import itertools
 import logging
+import re
 import urllib.parse
-from datetime import datetime, timedelta
-from typing import Any, Dict, List
+from datetime import date, datetime, timedelta
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Sequence, Tuple
+
+from extractors._badges import classify_badges
+from extractors._dom import DEFAULT_BACKEND, Selector
+from extractors.records import JobRecord
+
+# Selectors are compiled once at import time instead of once per card. Fallbacks
+# that target the same field in different layouts are folded into one comma
+# group, so those fields are resolved in a single pass.
+_INDEED_CARDS = (
+    ("div", "job_seen_beacon"),
+    ("td", "resultContent"),
+)
+_TITLE = Selector("h2.jobTitle a, a.tapItem")
+_COMPANY = Selector("span.companyName")
+_LOCATION = Selector("div.companyLocation, span.companyLocation")
+_DESCRIPTION = Selector("div.job-snippet")
+_SALARY = Selector("div.salary-snippet, span.salary-snippet-container")
+_BADGES = Selector("div.attribute_snippet, div.metadata")
+_DATE = Selector("span.date, span.dateStamp")
+
+# Opt-in fast path: pull title/link/company/location straight out of the raw
+# markup with regexes, with no tree at all. Each title link starts a card that
+# ends at the next title or 'job_seen_beacon' card; company and location are
+# only searched inside it, so a card missing one cannot borrow the next card's.
+# Every capture is written as "text, then any tag except the closing one", so
+# it cannot backtrack past its own element and the whole scan stays linear.
+_FAST_TITLE = (
+    r'<h2 class="jobTitle[^"]*"[^>]*>\s*<a[^>]*\bhref="([^"]+)"[^>]*>'
+    r'([^<]*(?:<(?!/a>|h2\b)[^<]*)*)</a>'
+)
+_FAST_CARD_END = r'<h2 class="jobTitle|class="job_seen_beacon[\s"]'
+_FAST_COMPANY = r'class="[^"]*\bcompanyName\b[^"]*"[^>]*>([^<]*(?:<(?!/span>)[^<]*)*)</span>'
+_FAST_LOCATION = (
+    r'class="[^"]*\bcompanyLocation\b[^"]*"[^>]*>'
+    r'([^<]*(?:<(?!/(?:div|span)>)[^<]*)*)</(?:div|span)>'
+)
+_FAST_PATTERNS = (_FAST_TITLE, _FAST_CARD_END, _FAST_COMPANY, _FAST_LOCATION)
+_FAST_INDEED_RES: Dict[type, Tuple[Any, ...]] = {
+    str: tuple(re.compile(pattern) for pattern in _FAST_PATTERNS),
+    bytes: tuple(re.compile(pattern.encode()) for pattern in _FAST_PATTERNS),
+}
+_TAG_RE = re.compile(r"<[^>]*>")
+
+# Indeed supports "jt" with values like "fulltime", "parttime", etc.
+_JOB_TYPE_CODES: Mapping[str, str] = MappingProxyType({
+    "full-time": "fulltime",
+    "fulltime": "fulltime",
+    "part-time": "parttime",
+    "parttime": "parttime",
+    "contract": "contract",
+    "internship": "internship",
+    "temporary": "temporary",
+})
+
+@functools.lru_cache(maxsize=256)
+def _encode_invariant(
+    keyword: str,
+    job_types: Tuple[str, ...],
+    remote_flags: Tuple[str, ...],
+) -> Tuple[str, str]:
+    """
+    Return the URL-encoded keyword and filter query strings for a search.
+
+    These do not depend on the location, so they are computed once per
+    (keyword, job_types, remote_flags) combination and reused across locations.
+    """
+    filters: Dict[str, Any] = {}
+
+    translated = [_JOB_TYPE_CODES[jt] for jt in job_types if jt in _JOB_TYPE_CODES]
+    if translated:
+        # Just pick the first, to keep it simple.
+        filters["jt"] = translated[0]
 
-from bs4 import BeautifulSoup  # type: ignore[import-untyped]
+    # Indeed offers remote filter via "sc" parameter, which is somewhat opaque.
+    # For now, we just encode a keyword for remote searches.
+    if "yes" in remote_flags or "remote" in remote_flags:
+        filters["sc"] = "0kf%3Ajt(telecommute)%3B"
+
+    return urllib.parse.urlencode({"q": keyword}), urllib.parse.urlencode(filters)
 
 def build_indeed_search_url(
     keyword: str,
     city: str = "",
     country: str = "",
-    job_types: List[str] | None = None,
-    remote_flags: List[str] | None = None,
+    job_types: Sequence[str] | None = None,
+    remote_flags: Sequence[str] | None = None,
 ) -> str:
     """
     Build a basic Indeed search URL.
@@ -21,9 +103,12 @@ def build_indeed_search_url(
     may need tuning for heavy use, but works for typical search scenarios.
     """
     base = "https://www.indeed.com/jobs"
-    query_params: Dict[str, Any] = {
-        "q": keyword,
-    }
+    keyword_query, filter_query = _encode_invariant(
+        keyword,
+        tuple(job_types or ()),
+        tuple(remote_flags or ()),
+    )
+    query_parts = [keyword_query]
 
     location_bits = []
     if city:
@@ -31,33 +116,18 @@ def build_indeed_search_url(
     if country:
         location_bits.append(country)
     if location_bits:
-        query_params["l"] = ", ".join(location_bits)
-
-    if job_types:
-        # Indeed supports "jt" with values like "fulltime", "parttime", etc.
-        jt_map = {
-            "full-time": "fulltime",
-            "fulltime": "fulltime",
-            "part-time": "parttime",
-            "parttime": "parttime",
-            "contract": "contract",
-            "internship": "internship",
-            "temporary": "temporary",
-        }
-        translated = [jt_map[jt] for jt in job_types if jt in jt_map]
-        if translated:
-            # Just pick the first, to keep it simple.
-            query_params["jt"] = translated[0]
-
-    if remote_flags:
-        # Indeed offers remote filter via "sc" parameter, which is somewhat opaque.
-        # For now, we just encode a keyword for remote searches.
-        if "yes" in remote_flags or "remote" in remote_flags:
-            query_params["sc"] = "0kf%3Ajt(telecommute)%3B"
-
-    return f"{base}?{urllib.parse.urlencode(query_params)}"
-
-def _parse_relative_date(date_str: str) -> str:
+        query_parts.append(urllib.parse.urlencode({"l": ", ".join(location_bits)}))
+
+    if filter_query:
+        query_parts.append(filter_query)
+
+    return f"{base}?{'&'.join(query_parts)}"
+
+def _parse_relative_date(
+    date_str: str,
+    today: date | None = None,
+    today_iso: str | None = None,
+) -> str:
     """
     Convert Indeed-style relative date strings into ISO date (YYYY-MM-DD).
 
@@ -67,14 +137,18 @@ def _parse_relative_date(date_str: str) -> str:
         '1 day ago' -> today - 1
         '30+ days ago' -> today - 30
     """
+    if today is None:
+        today = datetime.utcnow().date()
+    if today_iso is None:
+        today_iso = today.isoformat()
+
     date_str = date_str.strip().lower()
-    today = datetime.utcnow().date()
 
     if not date_str:
-        return today.isoformat()
+        return today_iso
 
     if "today" in date_str or "just posted" in date_str:
-        return today.isoformat()
+        return today_iso
 
     if "30+" in date_str:
         return (today - timedelta(days=30)).isoformat()
@@ -86,117 +160,165 @@ def _parse_relative_date(date_str: str) -> str:
             num = int(parts[0])
             return (today - timedelta(days=num)).isoformat()
         except (ValueError, IndexError):
-            return today.isoformat()
+            return today_iso
 
     # Fallback: return today
-    return today.isoformat()
+    return today_iso
+
+def _markup_text(fragment: str, sep: str = "") -> str:
+    """Text of an HTML fragment, joined the same way as the DOM backends do."""
+    pieces = (html_lib.unescape(piece).strip() for piece in _TAG_RE.split(fragment))
+    return sep.join(piece for piece in pieces if piece)
+
+def _iter_fast_cards(html: str | bytes) -> Iterator[Tuple[str, str, str, str]]:
+    """Yield raw (href, title, company, location) markup for each title link found."""
+    title_re, card_end_re, company_re, location_re = _FAST_INDEED_RES[type(html)]
+    empty = html[:0]
+    for title_match in title_re.finditer(html):
+        start = title_match.end()
+        card_end = card_end_re.search(html, start)
+        end = card_end.start() if card_end else len(html)
+        company = company_re.search(html, start, end)
+        location = location_re.search(html, start, end)
+        groups = (
+            title_match.group(1),
+            title_match.group(2),
+            company.group(1) if company else empty,
+            location.group(1) if location else empty,
+        )
+        if isinstance(html, bytes):
+            yield tuple(group.decode("utf-8", "replace") for group in groups)
+        else:
+            yield groups
+
+def _parse_indeed_jobs_fast(html: str | bytes, max_results: int) -> List[JobRecord]:
+    """
+    Regex-only extraction of the core fields (title, link, company, location).
+
+    Only cards with a title link are found. Fields that need the card tree
+    (job type, remote, salary, description, posted date) are left at their
+    "unknown" defaults.
+    """
+    today_iso = datetime.utcnow().date().isoformat()
+
+    jobs: List[JobRecord] = []
+    for href, title_html, company_html, location_html in itertools.islice(
+        _iter_fast_cards(html), max_results
+    ):
+        href = html_lib.unescape(href)
+        jobs.append(JobRecord(
+            title=_markup_text(title_html),
+            company=_markup_text(company_html),
+            location=_markup_text(location_html, " "),
+            jobtype=None,
+            remote="Unknown",
+            posted_date=today_iso,
+            link=f"https://www.indeed.com{href}" if href.startswith("/") else href,
+            description="",
+            salary=None,
+            source="Indeed",
+        ))
+    return jobs
 
 def parse_indeed_jobs(
-    html: str,
+    html: str | bytes,
     max_results: int = 50,
     logger: logging.Logger | None = None,
-) -> List[Dict[str, Any]]:
+    fast: bool = False,
+) -> List[JobRecord]:
     """
-    Parse Indeed job results from HTML into a list of structured dictionaries.
+    Parse Indeed job results from HTML into a list of JobRecord instances.
 
-    Each dict contains:
+    Each record contains:
         title, company, location, jobtype, remote, posted_date,
         link, description, salary, source
+
+    With ``fast=True`` a regex over the raw markup is tried first. It only
+    fills title, link, company and location, and falls back to the full
+    parser when it matches nothing (e.g. after a markup change).
     """
     if logger is None:
         logger = logging.getLogger(__name__)
 
-    soup = BeautifulSoup(html, "lxml")
+    if fast and html and max_results > 0:
+        fast_jobs = _parse_indeed_jobs_fast(html, max_results)
+        if fast_jobs:
+            return fast_jobs
+        logger.debug("Indeed fast path matched no cards; using the HTML parser.")
 
     # As of late 2024, Indeed uses 'td.resultContent' inside 'tr.job_seen_beacon',
     # but this has changed historically. We try a few selectors and merge.
-    cards = soup.select("div.job_seen_beacon")
-    if not cards:
-        cards = soup.select("td.resultContent")
-    if not cards:
+    # Cards are collected while the page streams through the parser, so only
+    # their subtrees are ever built, and parsing stops once max_results is reached.
+    dom = DEFAULT_BACKEND
+    cards = dom.iter_cards(html, _INDEED_CARDS) if html else iter(())
+    first_card = next(cards, None)
+    if first_card is None:
         logger.warning("No Indeed job cards found using known selectors.")
         return []
 
-    jobs: List[Dict[str, Any]] = []
+    jobs: List[JobRecord] = []
+    # The date does not change meaningfully within one page; resolve it once.
+    today = datetime.utcnow().date()
+    today_iso = today.isoformat()
 
-    for card in cards:
+    for card in itertools.chain((first_card,), cards):
         if len(jobs) >= max_results:
             break
 
         try:
             # Title & link
-            title_el = card.select_one("h2.jobTitle a") or card.select_one("a.tapItem")
-            title = title_el.get_text(strip=True) if title_el else ""
+            title_el = dom.first(card, _TITLE)
+            title = dom.text(title_el) if title_el is not None else ""
             link = ""
-            if title_el and title_el.has_attr("href"):
-                href = title_el["href"]
+            href = dom.attr(title_el, "href") if title_el is not None else None
+            if href:
                 if href.startswith("/"):
                     link = f"https://www.indeed.com{href}"
                 else:
                     link = href
 
             # Company
-            company_el = card.select_one("span.companyName")
-            company = company_el.get_text(strip=True) if company_el else ""
+            company_el = dom.first(card, _COMPANY)
+            company = dom.text(company_el) if company_el is not None else ""
 
             # Location
-            location_el = card.select_one("div.companyLocation") or card.select_one("span.companyLocation")
-            location = location_el.get_text(" ", strip=True) if location_el else ""
+            location_el = dom.first(card, _LOCATION)
+            location = dom.text(location_el, " ") if location_el is not None else ""
 
             # Summary / description
-            desc_el = card.select_one("div.job-snippet")
-            description = desc_el.get_text(" ", strip=True) if desc_el else ""
+            desc_el = dom.first(card, _DESCRIPTION)
+            description = dom.text(desc_el, " ") if desc_el is not None else ""
 
             # Salary
-            salary_el = card.select_one("div.salary-snippet") or card.select_one("span.salary-snippet-container")
-            salary = salary_el.get_text(" ", strip=True) if salary_el else ""
+            salary_el = dom.first(card, _SALARY)
+            salary = dom.text(salary_el, " ") if salary_el is not None else ""
 
             # Job type & remote tag (best-effort)
-            jobtype = ""
-            remote = "Unknown"
-            badge_texts = [
-                el.get_text(" ", strip=True)
-                for el in card.select("div.attribute_snippet") + card.select("div.metadata")
-            ]
-            for text in badge_texts:
-                lower = text.lower()
-                if any(t in lower for t in ["full-time", "full time"]):
-                    jobtype = "Full-time"
-                elif any(t in lower for t in ["part-time", "part time"]):
-                    jobtype = "Part-time"
-                elif "contract" in lower:
-                    jobtype = "Contract"
-                elif "internship" in lower:
-                    jobtype = "Internship"
-
-                if "remote" in lower:
-                    remote = "Yes"
-
-            if remote == "Unknown":
-                if any("on-site" in t.lower() or "on site" in t.lower() for t in badge_texts):
-                    remote = "No"
+            badge_texts = [dom.text(el, " ") for el in dom.all(card, _BADGES)]
+            jobtype, remote = classify_badges(badge_texts)
 
             # Posted date
-            date_el = card.select_one("span.date") or card.select_one("span.dateStamp")
-            posted_date_raw = date_el.get_text(strip=True) if date_el else ""
-            posted_date = _parse_relative_date(posted_date_raw)
+            date_el = dom.first(card, _DATE)
+            posted_date_raw = dom.text(date_el) if date_el is not None else ""
+            posted_date = _parse_relative_date(posted_date_raw, today, today_iso)
 
             if not title and not company and not link:
                 # Skip obviously empty entries
                 continue
 
-            job = {
-                "title": title,
-                "company": company,
-                "location": location,
-                "jobtype": jobtype or None,
-                "remote": remote,
-                "posted_date": posted_date,
-                "link": link,
-                "description": description,
-                "salary": salary or None,
-                "source": "Indeed",
-            }
+            job = JobRecord(
+                title=title,
+                company=company,
+                location=location,
+                jobtype=jobtype or None,
+                remote=remote,
+                posted_date=posted_date,
+                link=link,
+                description=description,
+                salary=salary or None,
+                source="Indeed",
+            )
 
             jobs.append(job)
         except Exception as exc:  # noqa: BLE001
@@ -1,18 +1,88 @@
-thonfrom __future__ import annotations
+from __future__ import annotations
 
+import functools
+import itertools
 import logging
+import re
 import urllib.parse
-from datetime import datetime, timedelta
-from typing import Any, Dict, List
+from datetime import date, datetime, timedelta
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
+
+from extractors._badges import classify_badges
+from extractors._dom import DEFAULT_BACKEND, Selector
+from extractors.records import JobRecord
+
+# Selectors are compiled once at import time instead of once per card. Fallbacks
+# that target the same field in different layouts are folded into one comma
+# group, so those fields are resolved in a single pass.
+_LINKEDIN_CARDS = (
+    ("li", "jobs-search-results__list-item"),
+    ("li", "jobs-search-results__list-item--active"),
+    ("div", "base-card"),  # fallback for newer UI variants
+)
+# The title keeps an ordered fallback: the full-card link usually precedes the
+# <h3> in document order, and a comma group would pick it first.
+_TITLE = Selector("h3.base-search-card__title")
+_LINK = Selector("a.base-card__full-link, a.job-card-list__title")
+_COMPANY = Selector("h4.base-search-card__subtitle a, a.job-card-container__company-name")
+_LOCATION = Selector("span.job-search-card__location")
+_INSIGHTS = Selector("ul.job-card-container__metadata-items li, div.job-search-card__benefits span")
+_DATE = Selector("time")
+_DESCRIPTION = Selector("p.job-search-card__snippet")
+
+# Currency symbols that mark an insight line as a salary.
+_SALARY_RE = re.compile("[$€£]")
+
+# Job type filter via 'f_JT' (comma-separated codes like F, P, C, I, T).
+_JOB_TYPE_CODES: Mapping[str, str] = MappingProxyType({
+    "full-time": "F",
+    "fulltime": "F",
+    "part-time": "P",
+    "parttime": "P",
+    "contract": "C",
+    "internship": "I",
+    "temporary": "T",
+})
+
+@functools.lru_cache(maxsize=256)
+def _encode_invariant(
+    keyword: str,
+    job_types: Tuple[str, ...],
+    remote_flags: Tuple[str, ...],
+) -> Tuple[str, str]:
+    """
+    Return the URL-encoded keyword and filter query strings for a search.
+
+    These do not depend on the location, so they are computed once per
+    (keyword, job_types, remote_flags) combination and reused across locations.
+    """
+    filters: Dict[str, Any] = {}
+
+    codes = [_JOB_TYPE_CODES[jt] for jt in job_types if jt in _JOB_TYPE_CODES]
+    if codes:
+        filters["f_JT"] = ",".join(codes)
 
-from bs4 import BeautifulSoup  # type: ignore[import-untyped]
+    # Remote / on-site filter via 'f_WT' (1=On-site, 2=Remote, 3=Hybrid)
+    flags = [f.lower() for f in remote_flags]
+    wt_codes = []
+    if any(f in flags for f in ["yes", "remote"]):
+        wt_codes.append("2")
+    if any(f in flags for f in ["no", "onsite", "on-site"]):
+        wt_codes.append("1")
+    if any("hybrid" in f for f in flags):
+        wt_codes.append("3")
+    if wt_codes:
+        filters["f_WT"] = ",".join(wt_codes)
+
+    return urllib.parse.urlencode({"keywords": keyword}), urllib.parse.urlencode(filters)
 
 def build_linkedin_search_url(
     keyword: str,
     city: str = "",
     country: str = "",
-    job_types: List[str] | None = None,
-    remote_flags: List[str] | None = None,
+    job_types: Sequence[str] | None = None,
+    remote_flags: Sequence[str] | None = None,
 ) -> str:
     """
     Build a basic LinkedIn Jobs search URL.
@@ -21,9 +91,12 @@ def build_linkedin_search_url(
     respect robots.txt, terms of service, and rate limits.
     """
     base = "https://www.linkedin.com/jobs/search/"
-    params: Dict[str, Any] = {
-        "keywords": keyword,
-    }
+    keyword_query, filter_query = _encode_invariant(
+        keyword,
+        tuple(job_types or ()),
+        tuple(remote_flags or ()),
+    )
+    query_parts = [keyword_query]
 
     location_bits = []
     if city:
@@ -31,57 +104,40 @@ def build_linkedin_search_url(
     if country:
         location_bits.append(country)
     if location_bits:
-        params["location"] = ", ".join(location_bits)
-
-    # Job type filter via 'f_JT' (comma-separated codes like F, P, C, I, T).
-    jt_map = {
-        "full-time": "F",
-        "fulltime": "F",
-        "part-time": "P",
-        "parttime": "P",
-        "contract": "C",
-        "internship": "I",
-        "temporary": "T",
-    }
-    if job_types:
-        codes = [jt_map[jt] for jt in job_types if jt in jt_map]
-        if codes:
-            params["f_JT"] = ",".join(codes)
+        query_parts.append(urllib.parse.urlencode({"location": ", ".join(location_bits)}))
 
-    # Remote / on-site filter via 'f_WT' (1=On-site, 2=Remote, 3=Hybrid)
-    if remote_flags:
-        flags = [f.lower() for f in remote_flags]
-        wt_codes = []
-        if any(f in flags for f in ["yes", "remote"]):
-            wt_codes.append("2")
-        if any(f in flags for f in ["no", "onsite", "on-site"]):
-            wt_codes.append("1")
-        if any("hybrid" in f for f in flags):
-            wt_codes.append("3")
-        if wt_codes:
-            params["f_WT"] = ",".join(wt_codes)
-
-    return f"{base}?{urllib.parse.urlencode(params)}"
-
-def _parse_relative_date(date_str: str) -> str:
+    if filter_query:
+        query_parts.append(filter_query)
+
+    return f"{base}?{'&'.join(query_parts)}"
+
+def _parse_relative_date(
+    date_str: str,
+    today: date | None = None,
+    today_iso: str | None = None,
+) -> str:
     """
     Convert LinkedIn-style relative date text into an ISO date.
 
     Examples:
         '1 day ago' / '2 weeks ago' / '5 hours ago'
     """
+    if today is None:
+        today = datetime.utcnow().date()
+    if today_iso is None:
+        today_iso = today.isoformat()
+
     date_str = date_str.strip().lower()
-    today = datetime.utcnow().date()
 
     if not date_str:
-        return today.isoformat()
+        return today_iso
 
     for needle in ["hour", "hours", "minute", "minutes"]:
         if needle in date_str:
-            return today.isoformat()
+            return today_iso
 
     if "today" in date_str:
-        return today.isoformat()
+        return today_iso
 
     if "yesterday" in date_str:
         return (today - timedelta(days=1)).isoformat()
@@ -91,7 +147,7 @@ def _parse_relative_date(date_str: str) -> str:
     try:
         num = int(parts[0])
     except (ValueError, IndexError):
-        return today.isoformat()
+        return today_iso
 
     unit = parts[1] if len(parts) > 1 else "days"
     if "week" in unit:
@@ -104,121 +160,90 @@ def _parse_relative_date(date_str: str) -> str:
     return (today - timedelta(days=delta_days)).isoformat()
 
 def parse_linkedin_jobs(
-    html: str,
+    html: str | bytes,
     max_results: int = 50,
     logger: logging.Logger | None = None,
-) -> List[Dict[str, Any]]:
+) -> List[JobRecord]:
     """
     Parse LinkedIn job search HTML page into structured records.
 
-    Each dict contains:
+    Each record contains:
         title, company, location, jobtype, remote, posted_date,
         link, description, salary, source
     """
     if logger is None:
         logger = logging.getLogger(__name__)
 
-    soup = BeautifulSoup(html, "lxml")
-
     # Main selector for job results. LinkedIn uses several layout variants,
     # so we test a few.
-    cards = soup.select("li.jobs-search-results__list-item")
-    if not cards:
-        cards = soup.select("li.jobs-search-results__list-item--active")
-    if not cards:
-        cards = soup.select("div.base-card")  # fallback for newer UI variants
-    if not cards:
+    # Cards are collected while the page streams through the parser, so only
+    # their subtrees are ever built, and parsing stops once max_results is reached.
+    dom = DEFAULT_BACKEND
+    cards = dom.iter_cards(html, _LINKEDIN_CARDS) if html else iter(())
+    first_card = next(cards, None)
+    if first_card is None:
         logger.warning("No LinkedIn job cards found with known selectors.")
         return []
 
-    jobs: List[Dict[str, Any]] = []
+    jobs: List[JobRecord] = []
+    # The date does not change meaningfully within one page; resolve it once.
+    today = datetime.utcnow().date()
+    today_iso = today.isoformat()
 
-    for card in cards:
+    for card in itertools.chain((first_card,), cards):
         if len(jobs) >= max_results:
             break
 
         try:
-            title_el = (
-                card.select_one("h3.base-search-card__title")
-                or card.select_one("a.job-card-list__title")
-                or card.select_one("a.base-card__full-link")
-            )
-            title = title_el.get_text(strip=True) if title_el else ""
+            title_el = dom.first(card, _TITLE, _LINK)
+            title = dom.text(title_el) if title_el is not None else ""
 
-            company_el = card.select_one("h4.base-search-card__subtitle a") or card.select_one(
-                "a.job-card-container__company-name",
-            )
-            company = company_el.get_text(strip=True) if company_el else ""
+            company_el = dom.first(card, _COMPANY)
+            company = dom.text(company_el) if company_el is not None else ""
 
-            location_el = card.select_one("span.job-search-card__location")
-            location = location_el.get_text(strip=True) if location_el else ""
+            location_el = dom.first(card, _LOCATION)
+            location = dom.text(location_el) if location_el is not None else ""
 
             link = ""
-            if title_el and title_el.name == "a" and title_el.has_attr("href"):
-                link = title_el["href"]
+            if title_el is not None and title_el.tag == "a" and dom.attr(title_el, "href"):
+                link = dom.attr(title_el, "href")
             else:
-                link_el = card.select_one("a.base-card__full-link") or card.select_one(
-                    "a.job-card-list__title",
-                )
-                if link_el and link_el.has_attr("href"):
-                    link = link_el["href"]
-
-            # Meta info: job type / remote indicator
-            jobtype = ""
-            remote = "Unknown"
+                link_el = dom.first(card, _LINK)
+                if link_el is not None and dom.attr(link_el, "href"):
+                    link = dom.attr(link_el, "href")
+
             description = ""
-            salary = None
 
-            # Job insights / meta lines
-            insights_els = card.select("ul.job-card-container__metadata-items li") or card.select(
-                "div.job-search-card__benefits span",
-            )
-            for el in insights_els:
-                text = el.get_text(" ", strip=True)
-                lower = text.lower()
-
-                if any(t in lower for t in ["full-time", "full time"]):
-                    jobtype = "Full-time"
-                elif any(t in lower for t in ["part-time", "part time"]):
-                    jobtype = "Part-time"
-                elif "contract" in lower:
-                    jobtype = "Contract"
-                elif "internship" in lower:
-                    jobtype = "Internship"
-
-                if "remote" in lower:
-                    remote = "Yes"
-                if "on-site" in lower or "on site" in lower:
-                    remote = "No"
-
-                if any(symbol in text for symbol in ["$", "€", "£"]):
-                    salary = text
+            # Job insights / meta lines: job type, remote indicator, salary
+            insights = [dom.text(el, " ") for el in dom.all(card, _INSIGHTS)]
+            jobtype, remote = classify_badges(insights, remote_wins=False)
+            salary = next((text for text in reversed(insights) if _SALARY_RE.search(text)), None)
 
             # Posted date
-            date_el = card.select_one("time")
-            posted_date_raw = date_el.get_text(strip=True) if date_el else ""
-            posted_date = _parse_relative_date(posted_date_raw)
+            date_el = dom.first(card, _DATE)
+            posted_date_raw = dom.text(date_el) if date_el is not None else ""
+            posted_date = _parse_relative_date(posted_date_raw, today, today_iso)
 
             # Description is not always present on listing cards; best-effort:
-            desc_el = card.select_one("p.job-search-card__snippet")
-            if desc_el:
-                description = desc_el.get_text(" ", strip=True)
+            desc_el = dom.first(card, _DESCRIPTION)
+            if desc_el is not None:
+                description = dom.text(desc_el, " ")
 
             if not title and not company and not link:
                 continue
 
-            job = {
-                "title": title,
-                "company": company,
-                "location": location,
-                "jobtype": jobtype or None,
-                "remote": remote,
-                "posted_date": posted_date,
-                "link": link,
-                "description": description,
-                "salary": salary,
-                "source": "LinkedIn",
-            }
+            job = JobRecord(
+                title=title,
+                company=company,
+                location=location,
+                jobtype=jobtype or None,
+                remote=remote,
+                posted_date=posted_date,
+                link=link,
+                description=description,
+                salary=salary,
+                source="LinkedIn",
+            )
 
             jobs.append(job)
         except Exception as exc:  # noqa: BLE001
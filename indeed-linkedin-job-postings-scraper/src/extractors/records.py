@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+@dataclass(slots=True)
+class JobRecord:
+    """
+    A single scraped job posting.
+
+    Fields are declared in the order they appear in the exported JSON. Slots
+    keep each record far smaller than the equivalent dict.
+    """
+
+    title: str
+    company: str
+    location: str
+    jobtype: Optional[str]
+    remote: str
+    posted_date: str
+    link: str
+    description: str
+    salary: Optional[str]
+    source: str
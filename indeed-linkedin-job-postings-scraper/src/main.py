@@ -1,13 +1,17 @@
-thonimport argparse
+import argparse
 import logging
 import sys
+import threading
 import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Tuple
 
 from utils.helpers import (
     setup_logging,
     load_json_file,
+    create_session,
     fetch_html,
     merge_job_lists_dedup,
 )
@@ -19,8 +23,24 @@ from extractors.linkedin_parser import (
     build_linkedin_search_url,
     parse_linkedin_jobs,
 )
+from extractors.records import JobRecord
 from outputs.exporter import export_to_json
 
+_PLATFORM_LABELS: Dict[str, str] = {
+    "indeed": "Indeed",
+    "linkedin": "LinkedIn",
+}
+
+_URL_BUILDERS: Dict[str, Callable[..., str]] = {
+    "indeed": build_indeed_search_url,
+    "linkedin": build_linkedin_search_url,
+}
+
+_PARSERS: Dict[str, Callable[..., List[JobRecord]]] = {
+    "indeed": parse_indeed_jobs,
+    "linkedin": parse_linkedin_jobs,
+}
+
 def _resolve_path(path_str: str) -> Path:
     p = Path(path_str)
     if not p.is_absolute():
@@ -61,8 +81,14 @@ def run_scraper(
         "Accept-Language": "en-US,en;q=0.9",
     }
 
-    all_results: List[Dict[str, Any]] = []
-    session_counter = 0
+    max_workers = max(1, int(config.get("max_workers", 8)))
+    per_host_limit = max(1, int(config.get("max_requests_per_host", 1)))
+    # Regex-only Indeed extraction: faster, but fills only title/link/company/location.
+    fast_parse = bool(config.get("fast_parse", False))
+
+    # Each task is (platform, url, title, city, country, max_results). Building the
+    # whole list up front lets requests to different hosts run concurrently.
+    tasks: List[Tuple[str, str, str, str, str, int]] = []
 
     for query_cfg in queries:
         title = query_cfg.get("title") or query_cfg.get("keyword") or ""
@@ -76,8 +102,9 @@ def run_scraper(
             continue
 
         platforms = [p.lower() for p in query_cfg.get("platforms", ["indeed", "linkedin"])]
-        job_types = [jt.lower() for jt in query_cfg.get("job_types", [])]
-        remote_flags = [r.lower() for r in query_cfg.get("remote", [])]
+        # Tuples, so the URL builders can memoize the location-independent parts.
+        job_types = tuple(jt.lower() for jt in query_cfg.get("job_types", []))
+        remote_flags = tuple(r.lower() for r in query_cfg.get("remote", []))
         max_results = int(query_cfg.get("max_results", 50))
 
         logger.info(
@@ -92,86 +119,86 @@ def run_scraper(
             country = loc.get("country", "")
             logger.info("Location: city='%s', country='%s'", city, country)
 
-            # INDEED
-            if "indeed" in platforms:
-                indeed_url = build_indeed_search_url(
+            for platform in ("indeed", "linkedin"):
+                if platform not in platforms:
+                    continue
+                build_url = _URL_BUILDERS[platform]
+                url = build_url(
                     keyword=title,
                     city=city,
                     country=country,
                     job_types=job_types,
                     remote_flags=remote_flags,
                 )
-                logger.info("Indeed search URL: %s", indeed_url)
-
-                try:
-                    html = fetch_html(
-                        indeed_url,
-                        headers=headers,
-                        proxies=proxies,
-                        timeout=20,
-                        logger=logger,
-                    )
-                    indeed_jobs = parse_indeed_jobs(
-                        html,
-                        max_results=max_results,
-                        logger=logger,
-                    )
-                    logger.info(
-                        "Parsed %d Indeed jobs for '%s' in %s, %s",
-                        len(indeed_jobs),
-                        title,
-                        city,
-                        country,
-                    )
-                    all_results.extend(indeed_jobs)
-                except Exception as exc:  # noqa: BLE001
-                    logger.exception("Failed to scrape Indeed for '%s': %s", title, exc)
-
-                session_counter += 1
-                if request_delay > 0:
-                    logger.debug("Sleeping %.2f seconds between requests.", request_delay)
-                    time.sleep(request_delay)
+                logger.info("%s search URL: %s", _PLATFORM_LABELS[platform], url)
+                tasks.append((platform, url, title, city, country, max_results))
 
-            # LINKEDIN
-            if "linkedin" in platforms:
-                linkedin_url = build_linkedin_search_url(
-                    keyword=title,
-                    city=city,
-                    country=country,
-                    job_types=job_types,
-                    remote_flags=remote_flags,
+    # One semaphore per host keeps each site at `max_requests_per_host` in-flight
+    # requests (plus the configured delay), while different hosts proceed in parallel.
+    host_slots = {
+        urllib.parse.urlsplit(url).netloc: threading.Semaphore(per_host_limit)
+        for _, url, *_ in tasks
+    }
+
+    # A single session for the run shares its connection pool across workers.
+    session = create_session(pool_size=max(32, max_workers))
+
+    def _fetch(url: str) -> str | bytes:
+        with host_slots[urllib.parse.urlsplit(url).netloc]:
+            try:
+                return fetch_html(
+                    url,
+                    headers=headers,
+                    proxies=proxies,
+                    timeout=20,
+                    logger=logger,
+                    session=session,
+                    decode=False,
                 )
-                logger.info("LinkedIn search URL: %s", linkedin_url)
-
-                try:
-                    html = fetch_html(
-                        linkedin_url,
-                        headers=headers,
-                        proxies=proxies,
-                        timeout=20,
-                        logger=logger,
-                    )
-                    linkedin_jobs = parse_linkedin_jobs(
-                        html,
-                        max_results=max_results,
-                        logger=logger,
-                    )
-                    logger.info(
-                        "Parsed %d LinkedIn jobs for '%s' in %s, %s",
-                        len(linkedin_jobs),
-                        title,
-                        city,
-                        country,
-                    )
-                    all_results.extend(linkedin_jobs)
-                except Exception as exc:  # noqa: BLE001
-                    logger.exception("Failed to scrape LinkedIn for '%s': %s", title, exc)
-
-                session_counter += 1
+            finally:
                 if request_delay > 0:
                     logger.debug("Sleeping %.2f seconds between requests.", request_delay)
                     time.sleep(request_delay)
 
+    results_by_task: Dict[int, List[JobRecord]] = {}
+
+    with session, ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_fetch, task[1]): index
+            for index, task in enumerate(tasks)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            platform, _, title, city, country, max_results = tasks[index]
+            label = _PLATFORM_LABELS[platform]
+            try:
+                html = future.result()
+                parse_options = {"fast": True} if fast_parse and platform == "indeed" else {}
+                jobs = _PARSERS[platform](
+                    html,
+                    max_results=max_results,
+                    logger=logger,
+                    **parse_options,
+                )
+                logger.info(
+                    "Parsed %d %s jobs for '%s' in %s, %s",
+                    len(jobs),
+                    label,
+                    title,
+                    city,
+                    country,
+                )
+                results_by_task[index] = jobs
+            except Exception as exc:  # noqa: BLE001
+                logger.exception("Failed to scrape %s for '%s': %s", label, title, exc)
+
+    # Keep the output order (and therefore which duplicate wins) independent of
+    # the order in which requests happened to finish.
+    all_results: List[JobRecord] = []
+    for index in sorted(results_by_task):
+        all_results.extend(results_by_task[index])
+    session_counter = len(tasks)
+
     if not all_results:
         logger.warning("No jobs collected. Nothing to export.")
         return
@@ -212,6 +239,19 @@ def main(argv: List[str] | None = None) -> int:
 
     logger = setup_logging(level=args.log_level)
 
-    project_root = Path(__file__).resolve().parents[1]
     input_path = _resolve_path(args.input)
-    if not input_path.is_absolute():
\ No newline at end of file
+    output_path = _resolve_path(args.output)
+
+    try:
+        run_scraper(
+            input_config_path=input_path,
+            output_path=output_path,
+            logger=logger,
+        )
+        return 0
+    except Exception as exc:  # noqa: BLE001
+        logger.exception("Fatal error while running scraper: %s", exc)
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,26 +1,40 @@
-thonfrom __future__ import annotations
+from __future__ import annotations
 
-import json
 import logging
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import TYPE_CHECKING, Iterable, Optional
+
+import orjson
+
+if TYPE_CHECKING:
+    from extractors.records import JobRecord
 
 def export_to_json(
-    jobs: Iterable[Dict[str, Any]],
+    jobs: Iterable[JobRecord],
     output_path: Path,
     logger: Optional[logging.Logger] = None,
 ) -> None:
     """
     Export job records as a JSON array to the given output path.
+
+    orjson serializes the slotted JobRecord dataclass natively, in field order.
     """
     if logger is None:
         logger = logging.getLogger(__name__)
 
-    job_list: List[Dict[str, Any]] = list(jobs)
-    logger.debug("Preparing to export %d jobs to %s", len(job_list), output_path)
+    logger.debug("Preparing to export jobs to %s", output_path)
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("w", encoding="utf-8") as f:
-        json.dump(job_list, f, ensure_ascii=False, indent=2)
+    # Records are encoded and written one at a time, so neither a copy of
+    # ``jobs`` nor the whole encoded array is ever held in memory. Each record
+    # is indented one extra level, giving the same layout as dumping the full
+    # list with OPT_INDENT_2 (JSON strings never contain raw newlines).
+    count = 0
+    with output_path.open("wb") as f:
+        for job in jobs:
+            f.write(b",\n  " if count else b"[\n  ")
+            f.write(orjson.dumps(job, option=orjson.OPT_INDENT_2).replace(b"\n", b"\n  "))
+            count += 1
+        f.write(b"\n]" if count else b"[]")
 
-    logger.info("Wrote %d job records to %s", len(job_list), output_path)
\ No newline at end of file
+    logger.info("Wrote %d job records to %s", count, output_path)
\ No newline at end of file
@@ -1,13 +1,19 @@
-thonfrom __future__ import annotations
+from __future__ import annotations
 
+import codecs
 import json
 import logging
-import time
+import re
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
 
 import requests
 from requests import Response, Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+if TYPE_CHECKING:
+    from extractors.records import JobRecord
 
 def setup_logging(level: str = "INFO") -> logging.Logger:
     """
@@ -39,9 +45,39 @@ def save_json_file(path: Path, data: Any) -> None:
     with path.open("w", encoding="utf-8") as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
 
-def _create_session() -> Session:
+_CHARSET_RE = re.compile(r"charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+_CHARSET_RE_BYTES = re.compile(rb"charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+# Browsers only look for a <meta charset> within the first 1024 bytes.
+_META_SNIFF_BYTES = 1024
+
+def create_session(
+    pool_size: int = 32,
+    max_retries: int = 3,
+    backoff_factor: float = 1.5,
+) -> Session:
+    """
+    Create a Session whose connection pool can be shared by concurrent fetches.
+
+    Reusing one session for a whole run keeps TCP/TLS connections alive between
+    requests to the same host instead of reconnecting on every call. Retries
+    (up to ``max_retries`` attempts in total) are handled by urllib3 inside the
+    adapter, with exponential backoff and honoring ``Retry-After`` headers.
+    """
+    retry = Retry(
+        total=max(0, max_retries - 1),
+        backoff_factor=backoff_factor,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET"]),
+        raise_on_status=False,
+    )
     session = requests.Session()
-    # Keep-alive is default; we can tune adapters here if needed.
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=retry,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
     return session
 
 def fetch_html(
@@ -49,90 +85,97 @@ def fetch_html(
     headers: Optional[Dict[str, str]] = None,
     proxies: Optional[Dict[str, str]] = None,
     timeout: float = 20.0,
-    max_retries: int = 3,
-    backoff_factor: float = 1.5,
     logger: Optional[logging.Logger] = None,
-) -> str:
+    session: Optional[Session] = None,
+    decode: bool = True,
+) -> str | bytes:
     """
     Fetch HTML content from a URL with retry and basic error handling.
+
+    Pass a shared ``session`` (see ``create_session``) to reuse pooled
+    connections and its retry policy across calls; otherwise a session with
+    the default policy is created for this call and closed afterwards.
+    Retries are configured on the session, so ``fetch_html`` no longer takes
+    ``max_retries`` / ``backoff_factor``; pass them to ``create_session``.
+
+    With ``decode=False`` the raw body is returned as UTF-8 bytes, which the
+    parsers accept directly. This skips requests' charset detection, which
+    scans the whole body. The charset comes from the Content-Type header or,
+    failing that, a ``<meta>`` tag near the top of the page; anything other
+    than UTF-8 is transcoded with invalid bytes replaced, and an unknown
+    charset is treated as UTF-8 the same way.
     """
     if logger is None:
         logger = logging.getLogger(__name__)
 
-    session = _create_session()
-    attempt = 0
-    last_exc: Exception | None = None
-
-    while attempt < max_retries:
-        attempt += 1
-        try:
-            logger.debug(
-                "HTTP GET %s (attempt %d/%d)",
-                url,
-                attempt,
-                max_retries,
-            )
-            resp: Response = session.get(
+    if session is None:
+        with create_session() as own_session:
+            return fetch_html(
                 url,
                 headers=headers,
                 proxies=proxies,
                 timeout=timeout,
-                allow_redirects=True,
-            )
-            resp.raise_for_status()
-            logger.debug(
-                "Received response %s with %d bytes.",
-                resp.status_code,
-                len(resp.content),
-            )
-            return resp.text
-        except (requests.RequestException, Exception) as exc:  # noqa: BLE001
-            last_exc = exc
-            logger.warning(
-                "Request to %s failed on attempt %d/%d: %s",
-                url,
-                attempt,
-                max_retries,
-                exc,
+                logger=logger,
+                session=own_session,
+                decode=decode,
             )
-            if attempt < max_retries:
-                sleep_time = backoff_factor ** (attempt - 1)
-                logger.debug("Sleeping %.2f seconds before retry.", sleep_time)
-                time.sleep(sleep_time)
-
-    msg = f"Failed to fetch {url} after {max_retries} attempts"
-    logger.error(msg)
-    if last_exc:
-        raise RuntimeError(msg) from last_exc
-    raise RuntimeError(msg)
-
-def merge_job_lists_dedup(jobs: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+
+    logger.debug("HTTP GET %s", url)
+    try:
+        resp: Response = session.get(
+            url,
+            headers=headers,
+            proxies=proxies,
+            timeout=timeout,
+            allow_redirects=True,
+        )
+        resp.raise_for_status()
+    except requests.RequestException as exc:
+        msg = f"Failed to fetch {url}: {exc}"
+        logger.error(msg)
+        raise RuntimeError(msg) from exc
+
+    logger.debug(
+        "Received response %s with %d bytes.",
+        resp.status_code,
+        len(resp.content),
+    )
+    if decode:
+        return resp.text
+
+    content = resp.content
+    charset_match = _CHARSET_RE.search(resp.headers.get("Content-Type", ""))
+    if charset_match:
+        charset = charset_match.group(1)
+    else:
+        meta_match = _CHARSET_RE_BYTES.search(content, 0, _META_SNIFF_BYTES)
+        charset = meta_match.group(1).decode("ascii") if meta_match else "utf-8"
+    try:
+        charset = codecs.lookup(charset).name
+    except LookupError:
+        logger.debug("Unknown charset %r for %s; decoding as UTF-8.", charset, url)
+        return content.decode("utf-8", "replace").encode("utf-8")
+    if charset == "utf-8":
+        # The parsers replace invalid UTF-8 bytes themselves while decoding.
+        return content
+    return content.decode(charset, "replace").encode("utf-8")
+
+def _dedup_key(job: JobRecord) -> str | Tuple[Any, ...]:
+    key = (job.link or "").strip()
+    if key:
+        return key
+    # Jobs without a link are kept but deduped by a tuple of their fields
+    return ("nolink", job.title, job.company, job.location)
+
+def merge_job_lists_dedup(jobs: Iterable[JobRecord]) -> List[JobRecord]:
     """
     Merge multiple job lists into a de-duplicated list based on job link.
 
     If multiple records share the same 'link', the first one wins.
     """
-    seen_links: set[str] = set()
-    merged: List[Dict[str, Any]] = []
-
+    # A single insertion-ordered dict replaces the seen-set + result-list pair:
+    # setdefault does the membership test and the insert in one probe.
+    merged: Dict[str | Tuple[Any, ...], JobRecord] = {}
     for job in jobs:
-        link = job.get("link") or ""
-        key = link.strip()
-        if not key:
-            # Jobs without a link are kept but deduped by a hash of fields
-            key = json.dumps(
-                {
-                    "title": job.get("title"),
-                    "company": job.get("company"),
-                    "location": job.get("location"),
-                },
-                sort_keys=True,
-            )
-
-        if key in seen_links:
-            continue
-
-        seen_links.add(key)
-        merged.append(job)
-
-    return merged
\ No newline at end of file
+        merged.setdefault(_dedup_key(job), job)
+    return list(merged.values())